@@ -1,20 +1,22 @@
+import asyncio
 import re
 from typing import Callable
 from pathlib import Path
 
-import redis.asyncio as redis
 from fastapi import FastAPI, Depends, HTTPException, Request, status
 from fastapi.responses import JSONResponse, HTMLResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi_limiter import FastAPILimiter
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.conf.config import config
-from src.database.db import get_db
+from src.database.db import get_db, sessionmanager
 from src.routes import contacts, users, auth
+from src.services.logger import get_logger
+
+logger = get_logger(__name__)
 
 app = FastAPI()
 
@@ -57,13 +59,17 @@ templates = Jinja2Templates(directory=BASE_DIR/"src"/"templates")
 
 @app.on_event("startup")
 async def startup():
-    r = await redis.Redis(
-        host=config.REDIS_DOMAIN,
-        port=config.REDIS_PORT,
-        db=0,
-        password=config.REDIS_PASSWORD,
-    )
-    await FastAPILimiter.init(r)
+    # Open every pooled connection up front so the first requests after boot
+    # do not pay the TCP/TLS/auth handshake one by one.
+    async def ping():
+        async with sessionmanager.session() as session:
+            await session.execute(text("SELECT 1"))
+
+    try:
+        await asyncio.gather(*(ping() for _ in range(config.DB_POOL_SIZE)))
+    except Exception:
+        # Warming is best effort; connections are opened lazily if it fails.
+        logger.exception("Connection pool warmup failed")
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -80,6 +86,6 @@ async def healthchecker(db: AsyncSession = Depends(get_db)):
         if result is None:
             raise HTTPException(status_code=500, detail="Database is not configured correctly")
         return {"message": "Welcome to FastAPI!"}
-    except Exception as e:
-        print(e)
+    except Exception:
+        logger.exception("Healthcheck query failed")
         raise HTTPException(status_code=500, detail="Error connecting to the database")
@@ -0,0 +1,65 @@
+"""Add contact composite indexes
+
+Revision ID: a1b9f3c2d7e4
+Revises: c05353f89524
+Create Date: 2025-01-12 18:40:11.204518
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a1b9f3c2d7e4"
+down_revision: Union[str, None] = "c05353f89524"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index("ix_contact_user_id_id", "contact", ["user_id", "id"], unique=False)
+    op.create_index(
+        "ix_contact_user_id_first_name",
+        "contact",
+        ["user_id", "first_name"],
+        unique=False,
+        postgresql_ops={"first_name": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_contact_user_id_last_name",
+        "contact",
+        ["user_id", "last_name"],
+        unique=False,
+        postgresql_ops={"last_name": "text_pattern_ops"},
+    )
+    op.create_index(
+        "ix_contact_user_id_birthday", "contact", ["user_id", "birthday"], unique=False
+    )
+    op.create_index(
+        "ix_contact_email_trgm",
+        "contact",
+        ["email"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"email": "gin_trgm_ops"},
+    )
+    op.drop_index(op.f("ix_contact_first_name"), table_name="contact")
+    op.drop_index(op.f("ix_contact_last_name"), table_name="contact")
+
+
+def downgrade() -> None:
+    op.create_index(
+        op.f("ix_contact_last_name"), "contact", ["last_name"], unique=False
+    )
+    op.create_index(
+        op.f("ix_contact_first_name"), "contact", ["first_name"], unique=False
+    )
+    op.drop_index("ix_contact_email_trgm", table_name="contact")
+    op.drop_index("ix_contact_user_id_birthday", table_name="contact")
+    op.drop_index("ix_contact_user_id_last_name", table_name="contact")
+    op.drop_index("ix_contact_user_id_first_name", table_name="contact")
+    op.drop_index("ix_contact_user_id_id", table_name="contact")
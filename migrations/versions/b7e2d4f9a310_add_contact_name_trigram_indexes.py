@@ -0,0 +1,44 @@
+"""Add contact name trigram indexes
+
+Revision ID: b7e2d4f9a310
+Revises: a1b9f3c2d7e4
+Create Date: 2025-01-19 21:05:37.612904
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2d4f9a310"
+down_revision: Union[str, None] = "a1b9f3c2d7e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_contact_first_name_trgm",
+        "contact",
+        ["first_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"first_name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_contact_last_name_trgm",
+        "contact",
+        ["last_name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"last_name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contact_last_name_trgm", table_name="contact")
+    op.drop_index("ix_contact_first_name_trgm", table_name="contact")
@@ -0,0 +1,32 @@
+"""Add contact birthday month-day expression index
+
+Revision ID: c8a4f61d2e95
+Revises: b7e2d4f9a310
+Create Date: 2025-01-19 21:42:18.309475
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8a4f61d2e95"
+down_revision: Union[str, None] = "b7e2d4f9a310"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # EXTRACT is IMMUTABLE (unlike to_char), so the month*100+day integer the
+    # upcoming-birthdays query filters on can be indexed as an expression.
+    op.execute(
+        "CREATE INDEX ix_contact_user_id_birthday_mmdd ON contact "
+        "(user_id, (EXTRACT(MONTH FROM birthday) * 100 + EXTRACT(DAY FROM birthday)))"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_contact_user_id_birthday_mmdd", table_name="contact")
@@ -1,15 +1,37 @@
 import contextlib
 
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.conf.config import config
+from src.services.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class DatabaseSessionManager:
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        engine_kwargs = {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": config.DB_POOL_SIZE,
+            "max_overflow": config.DB_MAX_OVERFLOW,
+            "pool_timeout": config.DB_POOL_TIMEOUT,
+            "pool_pre_ping": True,
+            "pool_recycle": config.DB_POOL_RECYCLE,
+        }
+        if url.startswith("postgresql+asyncpg"):
+            # Reuse asyncpg prepared statements and skip JIT planning for the
+            # short OLTP queries this app issues.
+            engine_kwargs["connect_args"] = {
+                "server_settings": {"jit": "off"},
+                "statement_cache_size": 1024,
+            }
+        self._engine: AsyncEngine | None = create_async_engine(url, **engine_kwargs)
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False,
+            autocommit=False,
+            expire_on_commit=False,
+            bind=self._engine,
         )
 
     @contextlib.asynccontextmanager
@@ -19,8 +41,8 @@ class DatabaseSessionManager:
         session = self._session_maker()
         try:
             yield session
-        except Exception as err:
-            print(err)
+        except Exception:
+            logger.exception("Database session failed; rolling back")
             await session.rollback()
             raise
         finally:
@@ -2,7 +2,7 @@ from datetime import date
 from typing import Optional
 
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Date, Integer, ForeignKey, func, DateTime, Boolean
+from sqlalchemy import String, Date, Integer, ForeignKey, func, DateTime, Boolean, Index
 from sqlalchemy.orm import DeclarativeBase
 
 
@@ -12,12 +12,45 @@ class Base(DeclarativeBase):
 
 class Contact(Base):
     __tablename__ = "contact"
-    id: Mapped[int] = mapped_column(primary_key=True)
-    first_name: Mapped[str] = mapped_column(String(50), index=True, nullable=False)
-    last_name: Mapped[str] = mapped_column(String(50), index=True, nullable=False)
-    email: Mapped[str] = mapped_column(
-        String(100), unique=True, index=True, nullable=False
+    __table_args__ = (
+        Index("ix_contact_user_id_id", "user_id", "id"),
+        Index(
+            "ix_contact_user_id_first_name",
+            "user_id",
+            "first_name",
+            postgresql_ops={"first_name": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_contact_user_id_last_name",
+            "user_id",
+            "last_name",
+            postgresql_ops={"last_name": "text_pattern_ops"},
+        ),
+        Index("ix_contact_user_id_birthday", "user_id", "birthday"),
+        Index(
+            "ix_contact_email_trgm",
+            "email",
+            postgresql_using="gin",
+            postgresql_ops={"email": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contact_first_name_trgm",
+            "first_name",
+            postgresql_using="gin",
+            postgresql_ops={"first_name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_contact_last_name_trgm",
+            "last_name",
+            postgresql_using="gin",
+            postgresql_ops={"last_name": "gin_trgm_ops"},
+        ),
     )
+    __mapper_args__ = {"eager_defaults": True}
+    id: Mapped[int] = mapped_column(primary_key=True)
+    first_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    last_name: Mapped[str] = mapped_column(String(50), nullable=False)
+    email: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     phone: Mapped[str] = mapped_column(String(16), nullable=False)
     birthday: Mapped[date] = mapped_column(Date, nullable=False)
     data_add: Mapped[Optional[str]] = mapped_column(String(250))
@@ -28,11 +61,12 @@ class Contact(Base):
         "updated_at", DateTime, default=func.now(), onupdate=func.now(), nullable=True
     )
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
-    user: Mapped["User"] = relationship("User", backref="contact", lazy="joined")
+    user: Mapped["User"] = relationship("User", backref="contact", lazy="raise")
 
 
 class User(Base):
     __tablename__ = "users"
+    __mapper_args__ = {"eager_defaults": True}
     id: Mapped[int] = mapped_column(primary_key=True)
     username: Mapped[str] = mapped_column(String(50))
     email: Mapped[str] = mapped_column(String(150), nullable=False, unique=True)
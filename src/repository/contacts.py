@@ -1,28 +1,70 @@
 from datetime import date, timedelta
 from typing import Optional, List
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Integer,
+    bindparam,
+    cast,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    or_,
+    select,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from src.database.models import Contact, User
 from src.schemas.contact import ContactSchema
 
+# Precompiled statements for the hot read paths; building the expression tree
+# once per process instead of per request also keeps the SQL shape stable for
+# asyncpg's prepared-statement cache. The response schemas no longer embed
+# the owning user, so the queries fetch contact rows only; raiseload('*')
+# guards against a lazy load sneaking back in.
+_get_contacts_stmt = lambda_stmt(
+    lambda: select(Contact, func.count().over().label("total"))
+    .where(Contact.user_id == bindparam("user_id"))
+    .options(raiseload("*"))
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+
+_get_contact_stmt = lambda_stmt(
+    lambda: select(Contact)
+    .where(
+        Contact.id == bindparam("contact_id"),
+        Contact.user_id == bindparam("user_id"),
+    )
+    .options(raiseload("*"))
+)
+
 
 async def get_contacts(limit: int, offset: int, db: AsyncSession, user: User):
     """
     Retrieves a list of contacts for a given user with the specified pagination options.
 
+    The total number of matching contacts is computed with a COUNT(*) OVER()
+    window in the same statement, so paginators get their total without a
+    second round-trip.
+
     Args:
         limit (int): Maximum number of contacts to return.
         offset (int): Number of contacts to skip.
         db (AsyncSession): Database session.
         user (User): The user for which to retrieve notes.
     Returns:
-        List[Contact]: List of contacts for a given user.
+        tuple[List[Contact], int]: The page of contacts and the total count.
     """
-    stmt = select(Contact).filter_by(user=user).offset(offset).limit(limit)
-    contacts = await db.execute(stmt)
-    return contacts.scalars().all()
+    result = await db.execute(
+        _get_contacts_stmt, {"user_id": user.id, "offset": offset, "limit": limit}
+    )
+    rows = result.unique().all()
+    contacts = [row.Contact for row in rows]
+    total = rows[0].total if rows else 0
+    return contacts, total
 
 
 async def get_contact(contact_id: int, db: AsyncSession, user: User):
@@ -37,8 +79,9 @@ async def get_contact(contact_id: int, db: AsyncSession, user: User):
     Returns:
         Contact: The contact object if found, otherwise None.
     """
-    stmt = select(Contact).filter_by(id=contact_id, user=user)
-    contact = await db.execute(stmt)
+    contact = await db.execute(
+        _get_contact_stmt, {"contact_id": contact_id, "user_id": user.id}
+    )
     return contact.scalar_one_or_none()
 
 
@@ -57,18 +100,45 @@ async def create_contact(body: ContactSchema, db: AsyncSession, user: User):
     contact = Contact(**body.model_dump(exclude_unset=True), user=user)
     db.add(contact)
     await db.commit()
-    await db.refresh(contact)
     return contact
 
 
+async def create_contacts_bulk(bodies: List[ContactSchema], db: AsyncSession, user: User):
+    """
+    Creates many contacts for a given user with one multi-row INSERT.
+
+    All rows go out as a single INSERT ... RETURNING executemany (the route
+    caps the batch at 500) committed in one transaction, instead of one
+    round-trip per contact.
+
+    Args:
+        bodies (List[ContactSchema]): The schemas of the contacts to be created.
+        db (AsyncSession): The database session to use for the operation.
+        user (User): The user to whom the new contacts will belong.
+
+    Returns:
+        List[Contact]: The newly created contact rows.
+    """
+    if not bodies:
+        return []
+    values = [
+        body.model_dump(exclude_unset=True) | {"user_id": user.id} for body in bodies
+    ]
+    result = await db.execute(insert(Contact).returning(Contact), values)
+    contacts = result.scalars().all()
+    await db.commit()
+    return contacts
+
+
 async def update_contact(
     contact_id: int, body: ContactSchema, db: AsyncSession, user: User
 ):
     """
     Updates an existing contact for a given user.
 
-    This function attempts to update a contact with the provided ID for the specified user.
-    If the contact is found, its details are updated with the information from the provided ContactSchema.
+    This function updates the contact with the provided ID for the specified user
+    in a single UPDATE ... RETURNING statement, avoiding the extra SELECT and
+    refresh round-trips.
 
     Args:
         contact_id (int): The ID of the contact to be updated.
@@ -79,18 +149,16 @@ async def update_contact(
     Returns:
         Contact: The updated contact object if found and updated successfully, None otherwise.
     """
-    stmt = select(Contact).filter_by(id=contact_id, user=user)
+    stmt = (
+        update(Contact)
+        .where(Contact.id == contact_id, Contact.user_id == user.id)
+        .values(**body.model_dump(exclude_unset=True))
+        .returning(Contact)
+        .execution_options(synchronize_session=False)
+    )
     result = await db.execute(stmt)
     contact = result.scalar_one_or_none()
-    if contact:
-        contact.first_name = body.first_name
-        contact.last_name = body.last_name
-        contact.email = body.email
-        contact.phone = body.phone
-        contact.birthday = body.birthday
-        contact.data_add = body.data_add
-        await db.commit()
-        await db.refresh(contact)
+    await db.commit()
     return contact
 
 
@@ -98,6 +166,9 @@ async def delete_contact(contact_id: int, db: AsyncSession, user: User):
     """
     Deletes a specific contact for a given user by contact ID.
 
+    The delete is issued as a single DELETE ... RETURNING statement instead of
+    a SELECT followed by a separate DELETE.
+
     Args:
         contact_id (int): The ID of the contact to be deleted.
         db (AsyncSession): The database session to use for the operation.
@@ -106,12 +177,15 @@ async def delete_contact(contact_id: int, db: AsyncSession, user: User):
     Returns:
         Contact: The deleted contact object if found and deleted successfully, None otherwise.
     """
-    stmt = select(Contact).filter_by(id=contact_id, user=user)
-    contact = await db.execute(stmt)
-    contact = contact.scalar_one_or_none()
-    if contact:
-        await db.delete(contact)
-        await db.commit()
+    stmt = (
+        delete(Contact)
+        .where(Contact.id == contact_id, Contact.user_id == user.id)
+        .returning(Contact)
+        .execution_options(synchronize_session=False)
+    )
+    result = await db.execute(stmt)
+    contact = result.scalar_one_or_none()
+    await db.commit()
     return contact
 
 
@@ -135,7 +209,7 @@ async def search_contacts(
     Returns:
         List[Contact]: A list of contacts that match the search parameters for the specified user.
     """
-    stmt = select(Contact).filter_by(user=user)
+    stmt = select(Contact).filter_by(user=user).options(raiseload("*"))
     if first_name:
         stmt = stmt.filter(Contact.first_name.ilike(f"%{first_name}%"))
     if last_name:
@@ -167,29 +241,46 @@ async def get_upcoming_birthdays(db: AsyncSession, user: User, days: int = 7):
     today = date.today()
     upcoming_contacts = []
 
-    stmt = select(Contact).filter_by(user=user)
-    contacts = await db.execute(stmt)
-
-    contacts = contacts.scalars().all()
-
-    for contact in contacts:
-        birthday_real = contact.birthday
+    # The month-day is computed as an integer (month * 100 + day) with
+    # IMMUTABLE functions, so the expression index created in the migrations
+    # can serve this filter (to_char is only STABLE and cannot be indexed).
+    bind = getattr(db, "bind", None)
+    if bind is not None and getattr(bind, "dialect", None) is not None and bind.dialect.name == "postgresql":
+        month_day = func.extract("month", Contact.birthday) * 100 + func.extract(
+            "day", Contact.birthday
+        )
+    else:
+        month_day = cast(func.strftime("%m%d", Contact.birthday), Integer)
+    window_start = today.month * 100 + today.day
+    window_end_date = today + timedelta(days=days)
+    window_end = window_end_date.month * 100 + window_end_date.day
+    if window_start <= window_end:
+        predicate = month_day.between(window_start, window_end)
+    else:
+        # The window wraps past December 31st.
+        predicate = or_(month_day >= window_start, month_day <= window_end)
+
+    stmt = select(
+        Contact.id, Contact.first_name, Contact.last_name, Contact.birthday
+    ).where(Contact.user_id == user.id, predicate)
+    rows = await db.execute(stmt)
+
+    for row in rows.all():
+        birthday_real = row.birthday
         birthday_this_year = birthday_real.replace(year=today.year)
         if birthday_this_year < today:
             birthday_this_year = birthday_real.replace(year=today.year + 1)
 
-        days_until_birthday = (birthday_this_year - today).days
-        if 0 <= days_until_birthday <= days:
-            congratulation_date = adjust_for_weekend(birthday_this_year)
-            congratulation_date_str = date_to_string(congratulation_date)
-            upcoming_contacts.append(
-                {
-                    "contact_id": contact.id,
-                    "first_name": contact.first_name,
-                    "last_name": contact.last_name,
-                    "congratulation_date": congratulation_date_str,
-                }
-            )
+        congratulation_date = adjust_for_weekend(birthday_this_year)
+        congratulation_date_str = date_to_string(congratulation_date)
+        upcoming_contacts.append(
+            {
+                "contact_id": row.id,
+                "first_name": row.first_name,
+                "last_name": row.last_name,
+                "congratulation_date": congratulation_date_str,
+            }
+        )
 
     return upcoming_contacts
 
@@ -1,14 +1,70 @@
+import asyncio
+import hashlib
 from datetime import datetime
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
-from passlib.context import CryptContext
+import bcrypt
 
+from src.conf.config import config
 from src.database.db import get_db
 from src.database.models import User
 from src.schemas.user import UserSchema
+from src.services.cache import async_cache as cache, blob_to_user, user_to_blob
+from src.services.logger import get_logger
+
+logger = get_logger(__name__)
+
+USER_CACHE_TTL = 60
+
+# Precompiled statement: the expression tree is built once and re-used, and the
+# fixed shape lets asyncpg re-use its server-side prepared statement.
+_user_by_email_stmt = lambda_stmt(
+    lambda: select(User).where(User.email == bindparam("email"))
+)
+
+
+def _user_cache_key(email: str) -> str:
+    return f"user:{email}"
+
+
+def _hash_password(password: str) -> str:
+    # Same bcrypt parameters as Auth.get_password_hash; kept local because
+    # importing the auth service here would be circular.
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS)).decode()
+
+
+def _gravatar_url(email: str) -> str:
+    """
+    Derive the deterministic Gravatar URL for an email address.
+
+    Gravatar URLs are a plain hash of the normalized email, so no network
+    round-trip is needed to build one.
+
+    Args:
+        email (str): The email address to derive the avatar URL for.
+
+    Returns:
+        str: The Gravatar image URL.
+    """
+    digest = hashlib.sha256(email.strip().lower().encode()).hexdigest()
+    return f"https://www.gravatar.com/avatar/{digest}"
+
+
+async def _invalidate_user_cache(email: str) -> None:
+    """
+    Drop the cached copy of a user after a mutating query.
+
+    Args:
+        email (str): The email address of the user whose cache entry to drop.
+    """
+    try:
+        await cache.delete(_user_cache_key(email))
+    except Exception:
+        logger.exception("Evicting cached user failed")
 
 
 async def get_user_by_email(email: str, db: AsyncSession = Depends(get_db)):
@@ -24,9 +80,23 @@ async def get_user_by_email(email: str, db: AsyncSession = Depends(get_db)):
         User: The user object retrieved from the database, or None if no user
         with the given email address was found.
     """
-    stmt = select(User).filter_by(email=email)
-    user = await db.execute(stmt)
+    try:
+        cached = await cache.get(_user_cache_key(email))
+    except Exception:
+        logger.exception("Reading cached user failed")
+        cached = None
+    if cached is not None:
+        return blob_to_user(cached)
+
+    user = await db.execute(_user_by_email_stmt, {"email": email})
     user = user.scalar_one_or_none()
+    if user is not None:
+        try:
+            await cache.set(
+                _user_cache_key(email), user_to_blob(user), ex=USER_CACHE_TTL
+            )
+        except Exception:
+            logger.exception("Caching user failed")
     return user
 
 
@@ -34,9 +104,10 @@ async def create_user(body: UserSchema, db: AsyncSession = Depends(get_db)):
     """
     Create a new user in the database.
 
-    This function takes a UserSchema object containing user data, attempts to retrieve an avatar
-    from Gravatar using the user's email, and then creates a new User object in the database
-    using the provided data and the retrieved avatar.
+    This function takes a UserSchema object containing user data, derives the
+    Gravatar avatar URL from the user's email, and inserts the new user with a
+    single INSERT ... ON CONFLICT DO NOTHING RETURNING statement, so the uniqueness
+    check and the insert cannot race each other.
 
     Args:
         body (UserSchema): The user data to be added to the database.
@@ -44,19 +115,25 @@ async def create_user(body: UserSchema, db: AsyncSession = Depends(get_db)):
         Defaults to Depends(get_db).
 
     Returns:
-        User: The newly created User object.
+        User: The newly created User object, or None if a user with the same
+        email already exists.
     """
-    avatar = None
-    try:
-        g = Gravatar(body.email)
-        avatar = g.get_image()
-    except Exception as err:
-        print(err)
-
-    new_user = User(**body.model_dump(), avatar=avatar)
-    db.add(new_user)
+    avatar = _gravatar_url(body.email)
+
+    bind = getattr(db, "bind", None)
+    if bind is not None and getattr(bind, "dialect", None) is not None and bind.dialect.name == "postgresql":
+        insert = pg_insert
+    else:
+        insert = sqlite_insert
+    stmt = (
+        insert(User)
+        .values(**body.model_dump(), avatar=avatar)
+        .on_conflict_do_nothing(index_elements=["email"])
+        .returning(User)
+    )
+    result = await db.execute(stmt)
+    new_user = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(new_user)
     return new_user
 
 
@@ -64,7 +141,9 @@ async def update_token(user: User, token: str | None, db: AsyncSession):
     """
     Update a user's refresh token.
 
-    This function updates the 'refresh_token' field of the given user with the provided token.
+    This function writes the provided token to the user's 'refresh_token' column with
+    a single UPDATE statement, so it works the same for session-loaded and cached
+    (detached) user instances.
 
     Args:
         user (User): The user object to update.
@@ -75,16 +154,23 @@ async def update_token(user: User, token: str | None, db: AsyncSession):
     Returns:
         None: The function does not return a value. The user's 'refresh_token' field is updated directly in the database.
     """
-    user.refresh_token = token
+    await db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(refresh_token=token)
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
+    await _invalidate_user_cache(user.email)
 
 
 async def confirmed_email(email: str, db: AsyncSession) -> None:
     """
     Mark a user's email as confirmed.
 
-    This function updates the 'confirmed' field of the user with the given email address to True, indicating that
-    the email address has been confirmed.
+    This function flips the 'confirmed' field of the user with the given email address
+    to True with a single UPDATE statement, indicating that the email address has been
+    confirmed.
 
     Args:
         email (str): The email address of the user to mark as confirmed.
@@ -93,16 +179,17 @@ async def confirmed_email(email: str, db: AsyncSession) -> None:
     Returns:
         None: The function does not return a value. The user's 'confirmed' field is updated directly in the database.
     """
-    user = await get_user_by_email(email, db)
-    user.confirmed = True
+    await db.execute(update(User).where(User.email == email).values(confirmed=True))
     await db.commit()
+    await _invalidate_user_cache(email)
 
 
 async def update_avatar_url(email: str, url: str | None, db: AsyncSession) -> User:
     """
     Update the avatar URL for a user.
 
-    This function updates the avatar URL associated with the given user email address.
+    This function updates the avatar URL associated with the given user email address
+    in a single UPDATE ... RETURNING statement.
 
     Args:
         email (str): The email address of the user to update.
@@ -113,10 +200,11 @@ async def update_avatar_url(email: str, url: str | None, db: AsyncSession) -> Us
     Returns:
         User: The updated User object with the new avatar URL.
     """
-    user = await get_user_by_email(email, db)
-    user.avatar = url
+    stmt = update(User).where(User.email == email).values(avatar=url).returning(User)
+    result = await db.execute(stmt)
+    user = result.scalar_one()
     await db.commit()
-    await db.refresh(user)
+    await _invalidate_user_cache(email)
     return user
 
 
@@ -135,12 +223,17 @@ async def update_user_password(email: str, new_password: str, db: AsyncSession)
     Returns:
         User: The updated User object with the new password.
     """
-    hashed_password = CryptContext(schemes=["bcrypt"], deprecated="auto").hash(
-        new_password
+    hashed_password = await asyncio.get_running_loop().run_in_executor(
+        None, _hash_password, new_password
+    )
+    stmt = (
+        update(User)
+        .where(User.email == email)
+        .values(password=hashed_password, updated_at=datetime.now())
+        .returning(User)
     )
-    user = await get_user_by_email(email, db)
-    user.password = hashed_password
-    user.updated_at = datetime.now()
+    result = await db.execute(stmt)
+    user = result.scalar_one()
     await db.commit()
-    await db.refresh(user)
+    await _invalidate_user_cache(email)
     return user
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 
 from fastapi import (
@@ -9,6 +10,7 @@ from fastapi import (
     BackgroundTasks,
     Request,
 )
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import (
     OAuth2PasswordRequestForm,
     HTTPAuthorizationCredentials,
@@ -20,7 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.db import get_db
 from src.repository import users as repositories_users
 from src.schemas.user import UserSchema, TokenSchema, UserResponse, RequestEmail
-from src.services.auth import auth_service
+from src.services.auth import _local, auth_service
 from src.services.email import send_email, send_email_password
 from src.conf import messages
 
@@ -52,13 +54,15 @@ async def signup(
     Returns:
         UserResponse: The newly created user object, formatted as a response model.
     """
-    exist_user = await repositories_users.get_user_by_email(body.email, db)
-    if exist_user:
+    # Hashing stays in the request path (on a worker thread): the row must
+    # never exist with a plaintext or placeholder password, and the client may
+    # log in immediately after the 201. Email delivery is already deferred.
+    body.password = await run_in_threadpool(auth_service.get_password_hash, body.password)
+    new_user = await repositories_users.create_user(body, db)
+    if new_user is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail=messages.ACCOUNT_EXIST
         )
-    body.password = auth_service.get_password_hash(body.password)
-    new_user = await repositories_users.create_user(body, db)
     bt.add_task(send_email, new_user.email, new_user.username, str(request.base_url))
     return new_user
 
@@ -95,13 +99,15 @@ async def login(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=messages.EMAIL_NOT_CONFIRMED,
         )
-    if not auth_service.verify_password(body.password, user.password):
+    if not await auth_service.verify_password(body.password, user.password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=messages.INVALID_PASSWORD
         )
     # Generate JWT
-    access_token = await auth_service.create_access_token(data={"sub": user.email})
-    refresh_token = await auth_service.create_refresh_token(data={"sub": user.email})
+    access_token, refresh_token = await asyncio.gather(
+        auth_service.create_access_token(data={"sub": user.email}),
+        auth_service.create_refresh_token(data={"sub": user.email}),
+    )
     await repositories_users.update_token(user, refresh_token, db)
     return {
         "access_token": access_token,
@@ -140,8 +146,10 @@ async def refresh_token(
             status_code=status.HTTP_401_UNAUTHORIZED, detail=messages.INVALID_TOKEN
         )
 
-    access_token = await auth_service.create_access_token(data={"sub": email})
-    refresh_token = await auth_service.create_refresh_token(data={"sub": email})
+    access_token, refresh_token = await asyncio.gather(
+        auth_service.create_access_token(data={"sub": email}),
+        auth_service.create_refresh_token(data={"sub": email}),
+    )
     await repositories_users.update_token(user, refresh_token, db)
     return {
         "access_token": access_token,
@@ -215,13 +223,17 @@ async def request_email(
 
 @router.post("/password-reset-request", status_code=status.HTTP_200_OK)
 async def request_password_reset(
-    email: EmailStr, request: Request, db: AsyncSession = Depends(get_db)
+    email: EmailStr,
+    background_tasks: BackgroundTasks,
+    request: Request,
+    db: AsyncSession = Depends(get_db),
 ):
     """
     Sends a password reset link to the user's email address.
 
     Args:
         email (EmailStr): The email address of the user requesting a password reset.
+        background_tasks (BackgroundTasks): The background task manager for executing tasks asynchronously.
         request (Request): The HTTP request object, used to retrieve the base URL for generating the reset link.
         db (AsyncSession): The database session to use for the operation. Defaults to a dependency-injected session.
 
@@ -238,9 +250,11 @@ async def request_password_reset(
             status_code=status.HTTP_404_NOT_FOUND, detail=messages.USER_NOT_FOUND
         )
     host = str(request.base_url)
-    token = auth_service.create_email_token_with_redis(email)
+    token = await auth_service.create_email_token_with_redis(email)
     reset_link = str(token)
-    await send_email_password(email, user.username, reset_link, host)
+    # SMTP handshake + TLS can take half a second; deliver after the response
+    # like the other mail-sending routes instead of blocking the request.
+    background_tasks.add_task(send_email_password, email, user.username, reset_link, host)
     return {"message": "Password reset link has been sent to your email"}
 
 
@@ -269,10 +283,13 @@ async def reset_password(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=messages.USER_NOT_FOUND
         )
-    updated_user = await repositories_users.update_user_password(
-        email, new_password, db
+    # The password UPDATE and the session-cache invalidation are independent,
+    # so run them concurrently.
+    _local.pop(email, None)
+    updated_user, _ = await asyncio.gather(
+        repositories_users.update_user_password(email, new_password, db),
+        auth_service.cache.delete(email),
     )
-    await auth_service.cache.delete(email)
     return {
         "message": f"Password updated successfully for user {updated_user.username}"
     }
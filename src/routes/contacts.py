@@ -1,23 +1,43 @@
-from typing import Optional, List
-
-from fastapi import APIRouter, HTTPException, Depends, status, Path, Query
-from fastapi_limiter.depends import RateLimiter
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    HTTPException,
+    Depends,
+    status,
+    Path,
+    Query,
+    Request,
+    Response,
+)
+from pydantic import TypeAdapter
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.database.models import User
 from src.repository import contacts as repositories_contact
-from src.schemas.contact import ContactSchema, ContactResponse
+from src.schemas.contact import (
+    ContactSchema,
+    ContactSchemaFast,
+    ContactResponse,
+    UpcomingBirthday,
+)
 from src.services.auth import auth_service
+from src.services.etag import conditional_response
+from src.services.limiter import contacts_limiter
 
 router = APIRouter(prefix="/contact", tags=["contact"])
 
+# Validating whole pages through one TypeAdapter is noticeably faster than
+# FastAPI's per-item response_model pass for large list responses.
+_CONTACT_LIST_ADAPTER = TypeAdapter(list[ContactResponse])
+
 
 @router.get(
     "/search",
-    response_model=list[ContactResponse],
-    dependencies=[Depends(RateLimiter(times=1, seconds=20))],
+    response_model=None,
+    dependencies=[Depends(contacts_limiter)],
 )
 async def search_contacts(
     first_name: Optional[str] = Query(None, min_length=1),
@@ -49,13 +69,13 @@ async def search_contacts(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contacts not found"
         )
-    return contacts
+    return _CONTACT_LIST_ADAPTER.validate_python(contacts, from_attributes=True)
 
 
 @router.get(
     "/upcoming_birthdays",
-    response_model=List[dict],
-    dependencies=[Depends(RateLimiter(times=1, seconds=20))],
+    response_model=list[UpcomingBirthday],
+    dependencies=[Depends(contacts_limiter)],
 )
 async def upcoming_birthdays(
     days: int = 7,
@@ -71,7 +91,7 @@ async def upcoming_birthdays(
         user (User): The currently authenticated user, used to filter contacts.
 
     Returns:
-        List[dict]: A list of dictionaries, each representing a contact with an upcoming birthday.
+        list[UpcomingBirthday]: A list of contacts with an upcoming birthday.
     """
     contacts = await repositories_contact.get_upcoming_birthdays(db, user, days)
     return contacts
@@ -80,9 +100,11 @@ async def upcoming_birthdays(
 @router.get(
     "/{contact_id}",
     response_model=ContactResponse,
-    dependencies=[Depends(RateLimiter(times=1, seconds=20))],
+    dependencies=[Depends(contacts_limiter)],
 )
 async def get_contact(
+    request: Request,
+    response: Response,
     contact_id: int = Path(ge=1),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(auth_service.get_current_user),
@@ -90,7 +112,12 @@ async def get_contact(
     """
     Retrieves a specific contact by its ID.
 
+    The response carries an ETag; clients revalidating with If-None-Match
+    get an empty 304 when the contact has not changed.
+
     Args:
+        request (Request): The HTTP request, read for the If-None-Match header.
+        response (Response): The HTTP response, used to set the ETag header.
         contact_id (int): The ID of the contact to retrieve (must be greater than or equal to 1).
         db (AsyncSession): The database session to use for the operation. Defaults to a dependency-injected session.
         user (User): The currently authenticated user, used to ensure the contact belongs to them.
@@ -104,15 +131,18 @@ async def get_contact(
     contact = await repositories_contact.get_contact(contact_id, db, user)
     if contact is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="NOT FOUND")
-    return contact
+    return conditional_response(
+        ContactResponse.model_validate(contact), request, response
+    )
 
 
 @router.get(
     "/",
-    response_model=list[ContactResponse],
-    dependencies=[Depends(RateLimiter(times=1, seconds=20))],
+    response_model=None,
+    dependencies=[Depends(contacts_limiter)],
 )
 async def get_contacts(
+    response: Response,
     limit: int = Query(10, ge=10, le=500),
     offset: int = Query(0, ge=0),
     db: AsyncSession = Depends(get_db),
@@ -121,7 +151,11 @@ async def get_contacts(
     """
     Retrieves a list of contacts for the authenticated user.
 
+    The total number of contacts for the user is returned in the X-Total-Count
+    response header for paginating clients.
+
     Args:
+        response (Response): The response object, used to set the X-Total-Count header.
         limit (int): The maximum number of contacts to retrieve. Defaults to 10, must be between 10 and 500.
         offset (int): The number of contacts to skip before starting to retrieve. Defaults to 0, must be non-negative.
         db (AsyncSession): The database session to use for the operation. Defaults to a dependency-injected session.
@@ -130,15 +164,16 @@ async def get_contacts(
     Returns:
         list[ContactResponse]: A list of contact objects matching the provided parameters.
     """
-    contacts = await repositories_contact.get_contacts(limit, offset, db, user)
-    return contacts
+    contacts, total = await repositories_contact.get_contacts(limit, offset, db, user)
+    response.headers["X-Total-Count"] = str(total)
+    return _CONTACT_LIST_ADAPTER.validate_python(contacts, from_attributes=True)
 
 
 @router.post(
     "/",
     response_model=ContactResponse,
     status_code=status.HTTP_201_CREATED,
-    dependencies=[Depends(RateLimiter(times=1, seconds=20))],
+    dependencies=[Depends(contacts_limiter)],
 )
 async def create_contact(
     body: ContactSchema,
@@ -160,7 +195,44 @@ async def create_contact(
     return contact
 
 
-@router.put("/{contact_id}", dependencies=[Depends(RateLimiter(times=1, seconds=20))])
+@router.post(
+    "/bulk",
+    response_model=None,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(contacts_limiter)],
+)
+async def create_contacts_bulk(
+    bodies: list[ContactSchemaFast],
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(auth_service.get_current_user),
+):
+    """
+    Creates a batch of contacts in the database with a single bulk insert.
+
+    Batches are capped at 500 rows so one request cannot hold the
+    transaction open for an arbitrarily large import.
+
+    Args:
+        bodies (list[ContactSchema]): The list of contacts to be created.
+        db (AsyncSession): The database session to use for the operation. Defaults to a dependency-injected session.
+        user (User): The currently authenticated user, used to associate the contacts with the user.
+
+    Raises:
+        HTTPException: If the batch contains more than 500 contacts.
+
+    Returns:
+        list[ContactResponse]: The newly created contact objects.
+    """
+    if len(bodies) > 500:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="At most 500 contacts per request",
+        )
+    contacts = await repositories_contact.create_contacts_bulk(bodies, db, user)
+    return _CONTACT_LIST_ADAPTER.validate_python(contacts, from_attributes=True)
+
+
+@router.put("/{contact_id}", dependencies=[Depends(contacts_limiter)])
 async def update_contact(
     body: ContactSchema,
     contact_id: int = Path(ge=1),
@@ -191,7 +263,7 @@ async def update_contact(
 @router.delete(
     "/{contact_id}",
     status_code=status.HTTP_204_NO_CONTENT,
-    dependencies=[Depends(RateLimiter(times=1, seconds=20))],
+    dependencies=[Depends(contacts_limiter)],
 )
 async def delete_contact(
     contact_id: int = Path(ge=1),
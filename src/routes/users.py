@@ -1,22 +1,34 @@
-import pickle
+import asyncio
 
 import cloudinary
 import cloudinary.uploader
 
-from fastapi import APIRouter, Depends, UploadFile, File
-from fastapi_limiter.depends import RateLimiter
-
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    UploadFile,
+    File,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
 from src.database.models import User
 from src.schemas.user import UserResponse
-from src.services.auth import auth_service
+from src.services.auth import _local, auth_service
+from src.services.cache import user_to_blob
+from src.services.etag import conditional_response
+from src.services.limiter import users_avatar_limiter, users_me_limiter
 from src.conf.config import config
 from src.repository import users as repositories_users
 
 router = APIRouter(prefix="/users", tags=["users"])
 
+MAX_AVATAR_SIZE = 2_000_000
+
 cloudinary.config(
     cloud_name=config.CLD_NAME,
     api_key=config.CLD_API_KEY,
@@ -28,29 +40,37 @@ cloudinary.config(
 @router.get(
     "/me",
     response_model=UserResponse,
-    dependencies=[Depends(RateLimiter(times=2, seconds=20))],
+    dependencies=[Depends(users_me_limiter)],
 )
-async def get_current_user(user: User = Depends(auth_service.get_current_user)):
+async def get_current_user(
+    request: Request,
+    response: Response,
+    user: User = Depends(auth_service.get_current_user),
+):
     """
     Retrieve the current authenticated user.
 
     This function retrieves the currently authenticated user from the request's context.
     It uses the `auth_service.get_current_user` function to fetch the user.
     The user is then returned as a response using the `UserResponse` model.
+    The profile rarely changes, so the response carries an ETag and clients
+    revalidating with If-None-Match get an empty 304 instead of the body.
 
     Parameters:
+    request (Request): The HTTP request, read for the If-None-Match header.
+    response (Response): The HTTP response, used to set the ETag header.
     user (User): The authenticated user. This parameter is optional and is injected by the FastAPI framework.
 
     Returns:
     UserResponse: The authenticated user's data, formatted according to the `UserResponse` model.
     """
-    return user
+    return conditional_response(UserResponse.model_validate(user), request, response)
 
 
 @router.patch(
     "/avatar",
     response_model=UserResponse,
-    dependencies=[Depends(RateLimiter(times=1, seconds=20))],
+    dependencies=[Depends(users_avatar_limiter)],
 )
 async def update_avatar_user(
     file: UploadFile = File(),
@@ -72,12 +92,26 @@ async def update_avatar_user(
     Returns:
     UserResponse: The updated user object, formatted according to the `UserResponse` model.
     """
+    if file.size and file.size > MAX_AVATAR_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="Avatar file is too large",
+        )
     public_id = f"Web25/{user.email}"
-    res = cloudinary.uploader.upload(file.file, public_id=public_id, owerite=True)
+    # The Cloudinary SDK is synchronous; run the multi-second upload on a
+    # worker thread so it does not stall the event loop. upload_large streams
+    # the file in chunks instead of buffering the whole body in memory.
+    res = await asyncio.to_thread(
+        cloudinary.uploader.upload_large,
+        file.file,
+        public_id=public_id,
+        overwrite=True,
+        chunk_size=6_000_000,
+    )
     res_url = cloudinary.CloudinaryImage(public_id).build_url(
         width=250, height=250, crop="fill", version=res.get("version")
     )
     user = await repositories_users.update_avatar_url(user.email, res_url, db)
-    auth_service.cache.set(user.email, pickle.dumps(user))
-    auth_service.cache.expire(user.email, 300)
+    _local.pop(user.email, None)
+    await auth_service.cache.set(user.email, user_to_blob(user), ex=300)
     return user
@@ -1,15 +1,13 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import BaseModel, Field, EmailStr, ConfigDict
-
-from src.schemas.user import UserResponse
+from pydantic import BaseModel, Field, EmailStr, ConfigDict, StringConstraints
 
 
 class ContactSchema(BaseModel):
     first_name: str = Field(min_length=1, max_length=50)
     last_name: str = Field(min_length=1, max_length=50)
-    email: str = EmailStr
+    email: EmailStr
     phone: str = Field(
         pattern=r"^\+?1?\d{9,15}$", description="Номер телефону"
     )
@@ -17,6 +15,20 @@ class ContactSchema(BaseModel):
     data_add: Optional[str] = Field(max_length=250, description="Додатково")
 
 
+class ContactSchemaFast(ContactSchema):
+    """
+    Bulk-import variant of :class:`ContactSchema`.
+
+    Checks the email shape with a cheap precompiled regex instead of the full
+    email-validator pass, which matters when validating hundreds of rows in
+    one request.
+    """
+
+    email: Annotated[
+        str, StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254)
+    ]
+
+
 class ContactResponse(BaseModel):
     id: int = 1
     first_name: str
@@ -26,7 +38,13 @@ class ContactResponse(BaseModel):
     birthday: date
     created_at: datetime | None
     updated_at: datetime | None
-    user: UserResponse | None
     data_add: str
 
-    model_config = ConfigDict(from_attributes=True) 
+    model_config = ConfigDict(from_attributes=True)
+
+
+class UpcomingBirthday(BaseModel):
+    contact_id: int
+    first_name: str
+    last_name: str
+    congratulation_date: str
@@ -1,34 +1,45 @@
-import pickle
-from datetime import datetime, timedelta
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional
 
-import redis
+import bcrypt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
-from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError, jwt, ExpiredSignatureError
+import jwt
+from jwt import ExpiredSignatureError, InvalidTokenError
 
 from src.conf.config import config
 from src.database.db import get_db
 from src.repository import users as repository_users
+from src.services.cache import async_cache, blob_to_user, user_to_blob
+from src.services.logger import get_logger
+
+# L1 in-process cache in front of Redis for the authenticated-user lookup.
+# The short TTL bounds how long a stale entry can outlive a Redis
+# invalidation issued by another process.
+logger = get_logger(__name__)
+
+_local = TTLCache(maxsize=10_000, ttl=60)
 
 
 class Auth:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    _hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
     SECRET_KEY = config.SECRET_KEY_JWT
     ALGORITHM = config.ALGORITHM
-    cache = redis.Redis(
-        host=config.REDIS_DOMAIN,
-        port=config.REDIS_PORT,
-        db=0,
-        password=config.REDIS_PASSWORD,
-    )
-
-    def verify_password(self, plain_password, hashed_password):
+    cache = async_cache
+
+    async def verify_password(self, plain_password, hashed_password):
         """
         Verify a plain password against a hashed password.
 
+        The CPU-heavy bcrypt check runs on a dedicated thread pool so it never
+        blocks the event loop.
+
         Args:
             plain_password (str): The plain password to verify.
             hashed_password (str): The hashed password to compare against.
@@ -36,11 +47,19 @@ class Auth:
         Returns:
             bool: True if the plain password matches the hashed password, False otherwise.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await asyncio.get_running_loop().run_in_executor(
+            self._hash_pool,
+            bcrypt.checkpw,
+            plain_password.encode(),
+            hashed_password.encode(),
+        )
 
     def get_password_hash(self, password: str):
         """
-        Hash a plain password using the configured password context.
+        Hash a plain password with bcrypt.
+
+        The hash format matches what passlib produced before, so existing
+        database rows keep verifying.
 
         Args:
             password (str): The plain password to hash.
@@ -48,10 +67,50 @@ class Auth:
         Returns:
             str: The hashed password.
         """
-        return self.pwd_context.hash(password)
+        return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=config.BCRYPT_ROUNDS)).decode()
 
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _decode_jwt_cached(token: str, key: str, algorithm: str) -> dict:
+        """
+        Verify a JWT signature and return its payload, memoized per token.
+
+        Expiry is checked by the caller, not here, so a cached payload cannot
+        outlive its exp claim.
+
+        Args:
+            token (str): The encoded JWT.
+            key (str): The signing key.
+            algorithm (str): The signing algorithm.
+
+        Returns:
+            dict: The decoded token payload.
+        """
+        return dict(
+            jwt.decode(token, key, algorithms=[algorithm], options={"verify_exp": False})
+        )
+
+    def _decode_token(self, token: str) -> dict:
+        """
+        Decode a JWT, using the signature-verification cache, and enforce expiry.
+
+        Args:
+            token (str): The encoded JWT.
+
+        Raises:
+            ExpiredSignatureError: If the token has expired.
+
+        Returns:
+            dict: The decoded token payload.
+        """
+        payload = self._decode_jwt_cached(token, self.SECRET_KEY, self.ALGORITHM)
+        exp = payload.get("exp")
+        if exp is not None and exp < time.time():
+            raise ExpiredSignatureError("Signature has expired.")
+        return payload
+
     # define a function to generate a new access token
     async def create_access_token(
         self, data: dict, expires_delta: Optional[float] = None
@@ -66,14 +125,13 @@ class Auth:
         Returns:
             str: The encoded access token.
         """
-        to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.now() + timedelta(seconds=expires_delta)
-        else:
-            expire = datetime.now() + timedelta(minutes=15)
-        to_encode.update(
-            {"iat": datetime.now(), "exp": expire, "scope": "access_token"}
-        )
+        now = int(time.time())
+        to_encode = {
+            **data,
+            "iat": now,
+            "exp": now + int(expires_delta or 900),
+            "scope": "access_token",
+        }
         encoded_access_token = jwt.encode(
             to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM
         )
@@ -93,14 +151,13 @@ class Auth:
         Returns:
             str: The encoded refresh token.
         """
-        to_encode = data.copy()
-        if expires_delta:
-            expire = datetime.now() + timedelta(seconds=expires_delta)
-        else:
-            expire = datetime.now() + timedelta(days=7)
-        to_encode.update(
-            {"iat": datetime.now(), "exp": expire, "scope": "refresh_token"}
-        )
+        now = int(time.time())
+        to_encode = {
+            **data,
+            "iat": now,
+            "exp": now + int(expires_delta or 7 * 24 * 3600),
+            "scope": "refresh_token",
+        }
         encoded_refresh_token = jwt.encode(
             to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM
         )
@@ -120,9 +177,7 @@ class Auth:
             str: The email extracted from the token.
         """
         try:
-            payload = jwt.decode(
-                refresh_token, self.SECRET_KEY, algorithms=[self.ALGORITHM]
-            )
+            payload = self._decode_token(refresh_token)
             if payload["scope"] == "refresh_token":
                 email = payload["sub"]
                 return email
@@ -130,7 +185,7 @@ class Auth:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid scope for token",
             )
-        except JWTError:
+        except InvalidTokenError:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Could not validate credentials",
@@ -159,30 +214,36 @@ class Auth:
         )
 
         try:
-            # Decode JWT
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            # Decode JWT; the memoized helper skips the HMAC for a token that
+            # was already verified within its lifetime.
+            payload = self._decode_token(token)
             if payload["scope"] == "access_token":
                 email = payload["sub"]
                 if email is None:
                     raise credentials_exception
             else:
                 raise credentials_exception
-        except JWTError as e:
+        except InvalidTokenError as e:
             raise credentials_exception
 
         user_hash = str(email)
-        user = self.cache.get(user_hash)
+        user = _local.get(user_hash)
+        if user is not None:
+            #  User from the in-process cache
+            return user
 
-        if user is None:
+        cached = await self.cache.get(user_hash)
+        if cached is None:
             #  User from database
             user = await repository_users.get_user_by_email(email, db)
             if user is None:
                 raise credentials_exception
-            self.cache.set(user_hash, pickle.dumps(user))
-            self.cache.expire(user_hash, 300)
+            # SET with EX is one round-trip; a separate EXPIRE would double it.
+            await self.cache.set(user_hash, user_to_blob(user), ex=300)
         else:
-            #  User from cache
-            user = pickle.loads(user)
+            #  User from Redis
+            user = blob_to_user(cached)
+        _local[user_hash] = user
         return user
 
     def create_email_token(self, data: dict):
@@ -195,9 +256,8 @@ class Auth:
         Returns:
             str: The encoded email token.
         """
-        to_encode = data.copy()
-        expire = datetime.now() + timedelta(days=1)
-        to_encode.update({"iat": datetime.now(), "exp": expire})
+        now = int(time.time())
+        to_encode = {**data, "iat": now, "exp": now + 24 * 3600}
         token = jwt.encode(to_encode, self.SECRET_KEY, algorithm=self.ALGORITHM)
         return token
 
@@ -215,17 +275,17 @@ class Auth:
             str: The email extracted from the token.
         """
         try:
-            payload = jwt.decode(token, self.SECRET_KEY, algorithms=[self.ALGORITHM])
+            payload = self._decode_token(token)
             email = payload["sub"]
             return email
-        except JWTError as e:
-            print(e)
+        except InvalidTokenError:
+            logger.exception("Invalid email verification token")
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Invalid token for email verification",
             )
 
-    def create_email_token_with_redis(self, email: str, expiration: int = 3600):
+    async def create_email_token_with_redis(self, email: str, expiration: int = 3600):
         """
         Create a new email token using JWT and store it in Redis.
 
@@ -237,7 +297,7 @@ class Auth:
             str: The encoded email token.
         """
         token = self.create_email_token({"sub": email})
-        self.cache.set(email, token, ex=expiration)
+        await self.cache.set(email, token, ex=expiration)
         return token
 
     async def verify_email_token_from_redis(self, token: str):
@@ -261,7 +321,7 @@ class Auth:
                     status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token"
                 )
 
-            redis_token = self.cache.get(email)
+            redis_token = await self.cache.get(email)
             if redis_token is None or redis_token.decode() != token:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -273,7 +333,7 @@ class Auth:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Token has expired"
             )
-        except JWTError:
+        except InvalidTokenError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid token"
             )
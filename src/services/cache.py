@@ -0,0 +1,65 @@
+import orjson
+import redis.asyncio
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.conf.config import config
+from src.database.models import User
+
+# Asynchronous client shared by the auth service and the user repository, so
+# cache round-trips never block the event loop.
+async_cache = redis.asyncio.Redis(
+    host=config.REDIS_DOMAIN,
+    port=config.REDIS_PORT,
+    db=0,
+    password=config.REDIS_PASSWORD,
+)
+
+
+def user_to_blob(user: User) -> bytes:
+    """
+    Serialize the user fields the app actually reads into an orjson blob.
+
+    Pickling the mapped instance drags the whole SQLAlchemy state along and
+    unpickling it on every request is pure-Python work; a plain dict of the
+    handful of fields the routes touch is both smaller and much faster to
+    parse. This is the one serialization every cached user goes through, so
+    the auth service and the repository always agree on the wire format.
+
+    Args:
+        user (User): The user to serialize.
+
+    Returns:
+        bytes: The orjson-encoded user fields.
+    """
+    return orjson.dumps(
+        {
+            "id": user.id,
+            "username": user.username,
+            "email": user.email,
+            "password": user.password,
+            "refresh_token": user.refresh_token,
+            "avatar": user.avatar,
+            "confirmed": user.confirmed,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+        }
+    )
+
+
+def blob_to_user(blob: bytes) -> User:
+    """
+    Rebuild a detached ``User`` instance from an orjson blob.
+
+    The instance is marked detached so that assigning it to a relationship
+    (e.g. ``Contact.user``) is treated as pointing at an existing row rather
+    than cascading a fresh INSERT.
+
+    Args:
+        blob (bytes): The orjson-encoded user fields.
+
+    Returns:
+        User: A detached user instance carrying the cached fields.
+    """
+    user = User(**orjson.loads(blob))
+    make_transient_to_detached(user)
+    return user
@@ -6,6 +6,7 @@ from pydantic import EmailStr
 
 from src.conf.config import config
 from src.services.auth import auth_service
+from src.services.logger import get_logger
 
 conf = ConnectionConfig(
     MAIL_USERNAME=config.MAIL_USERNAME,
@@ -21,6 +22,12 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent / "templates",
 )
 
+logger = get_logger(__name__)
+
+# One shared FastMail keeps a single Jinja environment with compiled
+# templates; building it per send re-scans TEMPLATE_FOLDER every time.
+_fm = FastMail(conf)
+
 
 async def send_email(email: EmailStr, username: str, host: str):
     """
@@ -52,10 +59,9 @@ async def send_email(email: EmailStr, username: str, host: str):
             },
             subtype=MessageType.html,
         )
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="verify_email.html")
-    except ConnectionErrors as err:
-        print(err)
+        await _fm.send_message(message, template_name="verify_email.html")
+    except ConnectionErrors:
+        logger.exception("Sending verification email failed")
 
 
 async def send_email_password(email: EmailStr, username: str, reset_link, host: str):
@@ -92,7 +98,6 @@ async def send_email_password(email: EmailStr, username: str, reset_link, host:
             },
             subtype=MessageType.html,
         )
-        fm = FastMail(conf)
-        await fm.send_message(message, template_name="reset_password.html")
-    except ConnectionErrors as err:
-        print(err)
+        await _fm.send_message(message, template_name="reset_password.html")
+    except ConnectionErrors:
+        logger.exception("Sending password reset email failed")
@@ -0,0 +1,32 @@
+import hashlib
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+
+
+def conditional_response(model: BaseModel, request: Request, response: Response):
+    """
+    Apply HTTP conditional-request handling to a single-resource response.
+
+    The ETag is a short blake2b hash of the serialized payload. When the
+    client sends a matching ``If-None-Match`` header, an empty 304 reply is
+    returned instead of re-sending an identical body; otherwise the ETag is
+    attached so the client can revalidate next time.
+
+    Args:
+        model (BaseModel): The validated response payload.
+        request (Request): The incoming request, read for If-None-Match.
+        response (Response): The outgoing response, used to set the ETag.
+
+    Returns:
+        BaseModel | Response: The payload, or a 304 response on a match.
+    """
+    etag = (
+        '"'
+        + hashlib.blake2b(model.model_dump_json().encode(), digest_size=8).hexdigest()
+        + '"'
+    )
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return model
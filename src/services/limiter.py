@@ -0,0 +1,83 @@
+import asyncio
+import time
+from functools import lru_cache
+
+from fastapi import HTTPException, Request, status
+
+# Above this many live buckets, a check prunes entries idle long enough to
+# have refilled completely, keeping memory bounded under many unique clients.
+_MAX_BUCKETS = 100_000
+
+
+class TokenBucketLimiter:
+    """
+    In-process token-bucket rate limiter used as a FastAPI dependency.
+
+    Each client/path pair is tracked as two floats (remaining tokens and the
+    time of the last refill), so a check is a dict lookup plus arithmetic —
+    no Redis round-trip before every handler. Buckets refill continuously at
+    ``times / seconds`` tokens per second up to a burst capacity of ``times``.
+
+    State lives in process memory, which is exactly right for single-instance
+    deployments; multi-instance setups get a per-instance limit.
+    """
+
+    def __init__(self, times: int = 1, seconds: int = 20):
+        self.rate = times / seconds
+        self.capacity = float(times)
+        self._buckets: dict[tuple[str, str], tuple[float, float]] = {}
+        self._lock = asyncio.Lock()
+
+    async def __call__(self, request: Request):
+        """
+        Check and consume one token for the calling client, or raise 429.
+
+        Args:
+            request (Request): The incoming request; the client host and the
+                route path form the bucket key.
+
+        Raises:
+            HTTPException: If the bucket for this client and path is empty.
+        """
+        client = request.client.host if request.client else "anonymous"
+        key = (client, request.scope["path"])
+        now = time.monotonic()
+        async with self._lock:
+            if len(self._buckets) > _MAX_BUCKETS:
+                cutoff = now - self.capacity / self.rate
+                self._buckets = {
+                    k: v for k, v in self._buckets.items() if v[1] > cutoff
+                }
+            tokens, last = self._buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last) * self.rate)
+            if tokens < 1.0:
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail="Too Many Requests",
+                )
+            self._buckets[key] = (tokens - 1.0, now)
+
+
+@lru_cache(maxsize=None)
+def rate_limiter(times: int = 1, seconds: int = 20) -> TokenBucketLimiter:
+    """
+    Return the shared limiter for a rate class.
+
+    Routes declaring the same (times, seconds) pair get one limiter
+    instance with one bucket table, instead of each decorator constructing
+    its own; bucket keys include the route path, so sharing an instance
+    never mixes limits between endpoints.
+
+    Args:
+        times (int): Allowed requests per window.
+        seconds (int): Window length in seconds.
+
+    Returns:
+        TokenBucketLimiter: The limiter for this rate class.
+    """
+    return TokenBucketLimiter(times=times, seconds=seconds)
+
+
+contacts_limiter = rate_limiter(1, 20)
+users_me_limiter = rate_limiter(2, 20)
+users_avatar_limiter = rate_limiter(1, 20)
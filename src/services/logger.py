@@ -0,0 +1,36 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+
+# All application loggers enqueue records here; a single listener thread
+# does the actual stream write, so a burst of errors (e.g. an SMTP outage)
+# never serializes request handlers on synchronous stdout flushes.
+_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+_handler = logging.StreamHandler()
+_handler.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+)
+
+_listener = logging.handlers.QueueListener(_queue, _handler)
+_listener.start()
+atexit.register(_listener.stop)
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Return a logger whose records are written by the background listener.
+
+    Args:
+        name (str): The logger name, normally the caller's ``__name__``.
+
+    Returns:
+        logging.Logger: A logger wired to the shared queue handler.
+    """
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.addHandler(logging.handlers.QueueHandler(_queue))
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
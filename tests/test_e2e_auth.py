@@ -1,8 +1,6 @@
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
-from pycparser.ply.yacc import token
-from sqlalchemy import select
 from fastapi import status
 
 from src.database.models import User
@@ -18,9 +16,7 @@ user_data = {
 }
 
 
-def test_signup(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.routes.auth.send_email", mock_send_email)
+def test_signup(client):
     response = client.post("api/auth/signup", json=user_data)
     assert response.status_code == 201, response.text
     data = response.json()
@@ -30,9 +26,7 @@ def test_signup(client, monkeypatch):
     assert "avatar" in data
 
 
-def test_signup_exist_user(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.routes.auth.send_email", mock_send_email)
+def test_signup_exist_user(client):
     response = client.post("api/auth/signup", json=user_data)
     assert response.status_code == 409, response.text
     data = response.json()
@@ -53,17 +47,10 @@ def test_not_confirmed_login(client):
 
 
 @pytest.mark.asyncio
-async def test_login(client):
-    async with TestingSessionLocal() as session:
-        current_user = await session.execute(
-            select(User).where(User.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            current_user.confirmed = True
-            await session.commit()
+async def test_login(async_client, set_confirmed):
+    await set_confirmed(user_data["email"], True)
 
-    response = client.post(
+    response = await async_client.post(
         "api/auth/login",
         data={
             "username": user_data.get("email"),
@@ -115,39 +102,36 @@ async def test_create_refresh_token_valid_user_data():
 
 
 @pytest.mark.asyncio
-async def test_refresh_token_successful(client):
+async def test_refresh_token_successful(async_client, test_user_id):
     refresh_token = await auth_service.create_refresh_token(
         data={"sub": test_user["email"]}
     )
+    # One session covers both the setup write and the verification read;
+    # refresh() re-fetches the row the endpoint updated.
     async with TestingSessionLocal() as session:
-        result = await session.execute(
-            select(User).where(User.email == test_user["email"])
-        )
-        user = result.scalar_one()
+        user = await session.get(User, test_user_id)
         user.refresh_token = refresh_token
         await session.commit()
-    response = client.get(
-        "/api/auth/refresh_token", headers={"Authorization": f"Bearer {refresh_token}"}
-    )
 
-    assert response.status_code == status.HTTP_200_OK
-    tokens = TokenSchema(**response.json())
-    assert tokens.token_type == "bearer"
-    assert isinstance(tokens.access_token, str)
-    assert isinstance(tokens.refresh_token, str)
-
-    async with TestingSessionLocal() as session:
-        updated_user = await session.execute(
-            select(User).where(User.email == test_user["email"])
+        response = await async_client.get(
+            "/api/auth/refresh_token",
+            headers={"Authorization": f"Bearer {refresh_token}"},
         )
-        updated_user = updated_user.scalar_one()
-        assert updated_user.refresh_token == tokens.refresh_token
+
+        assert response.status_code == status.HTTP_200_OK
+        tokens = TokenSchema(**response.json())
+        assert tokens.token_type == "bearer"
+        assert isinstance(tokens.access_token, str)
+        assert isinstance(tokens.refresh_token, str)
+
+        await session.refresh(user)
+        assert user.refresh_token == tokens.refresh_token
 
 
 @pytest.mark.asyncio
-async def test_api_response_with_invalid_refresh_token(client):
+async def test_api_response_with_invalid_refresh_token(async_client):
     invalid_refresh_token = "invalid_token"
-    response = client.get(
+    response = await async_client.get(
         "api/auth/refresh_token",
         headers={"Authorization": f"Bearer {invalid_refresh_token}"},
     )
@@ -155,62 +139,41 @@ async def test_api_response_with_invalid_refresh_token(client):
 
 
 @pytest.mark.asyncio
-async def test_confirm_email_success(client, get_token):
-    async with TestingSessionLocal() as session:
-        result = await session.execute(
-            select(User).where(User.email == test_user["email"])
-        )
-        user = result.scalar_one()
-        user.confirmed = False
-        await session.commit()
+async def test_confirm_email_success(async_client, get_token, set_confirmed, test_user_id):
+    await set_confirmed(test_user["email"], False)
     token = auth_service.create_email_token(data={"sub": test_user["email"]})
-    response = client.get(f"api/auth/confirmed_email/{token}")
+    response = await async_client.get(f"api/auth/confirmed_email/{token}")
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"message": "Email confirmed"}
     async with TestingSessionLocal() as session:
-        result = await session.execute(
-            select(User).where(User.email == test_user["email"])
-        )
-        user = result.scalar_one()
+        user = await session.get(User, test_user_id)
         assert user.confirmed is True
 
 
 @pytest.mark.asyncio
-async def test_confirm_email_already_confirmed(client, get_token):
-    async with TestingSessionLocal() as session:
-        result = await session.execute(
-            select(User).where(User.email == test_user["email"])
-        )
-        user = result.scalar_one()
-        user.confirmed = True
-        await session.commit()
+async def test_confirm_email_already_confirmed(async_client, get_token, set_confirmed):
+    await set_confirmed(test_user["email"], True)
     token = auth_service.create_email_token(data={"sub": test_user["email"]})
-    response = client.get(f"api/auth/confirmed_email/{token}")
+    response = await async_client.get(f"api/auth/confirmed_email/{token}")
     assert response.status_code == status.HTTP_200_OK
     assert response.json() == {"message": "Your email is already confirmed"}
 
 
 @pytest.mark.asyncio
-async def test_confirm_email_user_not_found(client, get_token):
+async def test_confirm_email_user_not_found(async_client, get_token):
     non_existing_email = "nonexistinguser@example.com"
     token = auth_service.create_email_token(data={"sub": non_existing_email})
-    response = client.get(f"api/auth/confirmed_email/{token}")
+    response = await async_client.get(f"api/auth/confirmed_email/{token}")
     assert response.status_code == status.HTTP_400_BAD_REQUEST
     assert response.json()["detail"] == messages.VERIFICATION_ERROR
 
 
 @pytest.mark.asyncio
-async def test_request_email_success(client):
-    async with TestingSessionLocal() as session:
-        result = await session.execute(
-            select(User).where(User.email == test_user["email"])
-        )
-        user = result.scalar_one()
-        user.confirmed = False
-        await session.commit()
+async def test_request_email_success(async_client, set_confirmed, test_user_id):
+    await set_confirmed(test_user["email"], False)
 
     with patch("src.routes.auth.send_email", new_callable=AsyncMock) as mock_send_email:
-        response = client.post(
+        response = await async_client.post(
             "api/auth/request_email", json={"email": test_user["email"]}
         )
         mock_send_email.assert_awaited_once_with(
@@ -220,25 +183,16 @@ async def test_request_email_success(client):
         assert response.json() == {"message": "Check your email for confirmation."}
 
     async with TestingSessionLocal() as session:
-        result = await session.execute(
-            select(User).where(User.email == test_user["email"])
-        )
-        user = result.scalar_one()
+        user = await session.get(User, test_user_id)
         assert user.confirmed is False
 
 
 @pytest.mark.asyncio
-async def test_request_email_already_confirmed(client):
-    async with TestingSessionLocal() as session:
-        result = await session.execute(
-            select(User).where(User.email == test_user["email"])
-        )
-        user = result.scalar_one()
-        user.confirmed = True
-        await session.commit()
+async def test_request_email_already_confirmed(async_client, set_confirmed):
+    await set_confirmed(test_user["email"], True)
 
     with patch("src.routes.auth.send_email", new_callable=AsyncMock) as mock_send_email:
-        response = client.post(
+        response = await async_client.post(
             "api/auth/request_email", json={"email": test_user["email"]}
         )
         mock_send_email.assert_not_called()
@@ -247,18 +201,11 @@ async def test_request_email_already_confirmed(client):
 
 
 @pytest.mark.asyncio
-async def test_password_reset_request_success(client):
-    async with TestingSessionLocal() as session:
-        current_user = await session.execute(
-            select(User).where(User.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            current_user.confirmed = True
-            await session.commit()
+async def test_password_reset_request_success(async_client, set_confirmed):
+    await set_confirmed(user_data["email"], True)
     with patch.object(auth_service, "cache", new_callable=AsyncMock) as mock_redis:
         mock_redis.get.return_value = user_data.get("email")
-        response = client.post(
+        response = await async_client.post(
             "api/auth/password-reset-request", params={"email": user_data.get("email")}
         )
         assert response.status_code == 200, response.text
@@ -268,16 +215,9 @@ async def test_password_reset_request_success(client):
 
 
 @pytest.mark.asyncio
-async def test_password_reset_request_user_not_found(client):
-    async with TestingSessionLocal() as session:
-        current_user = await session.execute(
-            select(User).where(User.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            current_user.confirmed = True
-            await session.commit()
-    response = client.post(
+async def test_password_reset_request_user_not_found(async_client, set_confirmed):
+    await set_confirmed(user_data["email"], True)
+    response = await async_client.post(
         "api/auth/password-reset-request", params={"email": "no_correct@email.com"}
     )
     assert response.status_code == 404, response.text
@@ -285,15 +225,8 @@ async def test_password_reset_request_user_not_found(client):
 
 
 @pytest.mark.asyncio
-async def test_reset_password_success(client):
-    async with TestingSessionLocal() as session:
-        current_user = await session.execute(
-            select(User).where(User.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            current_user.confirmed = True
-            await session.commit()
+async def test_reset_password_success(async_client, set_confirmed):
+    await set_confirmed(user_data["email"], True)
     token = "mocked-token"
     email = user_data.get("email")
     with patch.object(auth_service, "cache", new_callable=AsyncMock) as mock_redis:
@@ -302,7 +235,7 @@ async def test_reset_password_success(client):
         ) as mock_verify_token:
             mock_redis.get.return_value = email
             mock_verify_token.return_value = email
-            response = client.post(
+            response = await async_client.post(
                 "api/auth/password-reset",
                 params={"token": token, "new_password": "87654321"},
             )
@@ -313,15 +246,8 @@ async def test_reset_password_success(client):
 
 
 @pytest.mark.asyncio
-async def test_reset_password_not_found(client):
-    async with TestingSessionLocal() as session:
-        current_user = await session.execute(
-            select(User).where(User.email == user_data.get("email"))
-        )
-        current_user = current_user.scalar_one_or_none()
-        if current_user:
-            current_user.confirmed = True
-            await session.commit()
+async def test_reset_password_not_found(async_client, set_confirmed):
+    await set_confirmed(user_data["email"], True)
     token = "mocked-token"
     email = user_data.get("email")
     with patch.object(auth_service, "cache", new_callable=AsyncMock) as mock_redis:
@@ -330,7 +256,7 @@ async def test_reset_password_not_found(client):
         ) as mock_verify_token:
             mock_redis.get.return_value = email
             mock_verify_token.return_value = None
-            response = client.post(
+            response = await async_client.post(
                 "api/auth/password-reset",
                 params={"token": token, "new_password": "87654321"},
             )
@@ -1,8 +1,8 @@
-import unittest
+from collections import namedtuple
 from datetime import date, timedelta
-from unittest.mock import MagicMock, AsyncMock, Mock
+from unittest.mock import MagicMock, AsyncMock
 
-from sqlalchemy.ext.asyncio import AsyncSession
+import pytest
 
 from src.database.models import Contact, User
 from src.schemas.contact import ContactSchema
@@ -10,6 +10,7 @@ from src.repository.contacts import (
     get_contacts,
     get_contact,
     create_contact,
+    create_contacts_bulk,
     update_contact,
     delete_contact,
     search_contacts,
@@ -19,361 +20,365 @@ from src.repository.contacts import (
 )
 
 
-class TestAsyncContact(unittest.IsolatedAsyncioTestCase):
+class FakeAsyncSession:
+    """
+    Hand-rolled stand-in for ``AsyncSession``.
 
-    def setUp(self) -> None:
-        self.user = User(id=1, username="test_user", password="qwerty", confirmed=True)
-        self.session = AsyncMock(spec=AsyncSession)
+    The contact repository only ever touches these five methods, so a tiny
+    class beats ``AsyncMock(spec=AsyncSession)``: no spec walk at
+    construction time and no mock ``__getattr__`` machinery on every call.
+    """
 
-    async def test_get_contacts(self):
-        limit = 10
-        offset = 0
-        contacts = [
-            Contact(id=1, first_name="contact_1", email="email_1", user=self.user),
-            Contact(id=2, first_name="contact_2", email="email_2", user=self.user),
-        ]
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = contacts
-        self.session.execute.return_value = mocked_contacts
-        result = await get_contacts(limit, offset, self.session, self.user)
-        self.assertEqual(result, contacts)
-
-    async def test_get_contact_found(self):
-        contact = Contact(id=1, first_name="contact", email="email", user=self.user)
-        mocked_contact = Mock()
-        mocked_contact.scalar_one_or_none.return_value = contact
-        self.session.execute.return_value = mocked_contact
-        result = await get_contact(1, self.session, self.user)
-        self.assertEqual(result, contact)
-
-    async def test_get_contact_not_found(self):
-        mocked_contact = Mock()
-        mocked_contact.scalar_one_or_none.return_value = None
-        self.session.execute.return_value = mocked_contact
-        result = await get_contact(1, self.session, self.user)
-        self.assertIsNone(result)
-
-    async def test_create_contact(self):
-        body = ContactSchema(
+    def __init__(self):
+        self.execute = AsyncMock()
+        self.add = MagicMock()
+        self.commit = AsyncMock()
+        self.refresh = AsyncMock()
+        self.delete = AsyncMock()
+
+
+# Distinguishes "not configured" from an explicit None return value.
+_MISSING = object()
+
+
+class _ScalarsResult:
+    """``execute()`` result whose rows are read via ``.scalars().all()``."""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items):
+        self._items = items
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._items
+
+
+class _RowsResult:
+    """``execute()`` result read via ``.all()``, optionally after ``.unique()``."""
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def unique(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _ScalarResult:
+    """``execute()`` result read via ``.scalar_one[_or_none]()``."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one(self):
+        return self._value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+
+def _make_result(
+    scalars_all=_MISSING, scalar_one_or_none=_MISSING, rows=_MISSING, unique_rows=_MISSING
+):
+    """
+    Build a plain stand-in for an ``execute()`` result.
+
+    Dispatches to one of the ``__slots__`` wrapper classes above; they are
+    cheaper to allocate than mock chains and an access path a test did not
+    configure raises AttributeError instead of yielding a child mock.
+    """
+    if scalars_all is not _MISSING:
+        return _ScalarsResult(scalars_all)
+    if scalar_one_or_none is not _MISSING:
+        return _ScalarResult(scalar_one_or_none)
+    if rows is not _MISSING:
+        return _RowsResult(rows)
+    return _RowsResult(unique_rows)
+
+
+# Sampled once at import; every birthday expectation derives from the same
+# day, so the suite cannot straddle a midnight rollover mid-module.
+_TODAY = date.today()
+
+
+def _expected_bday(contact, today):
+    """Expected get_upcoming_birthdays payload row for one contact."""
+    return {
+        "contact_id": contact.id,
+        "first_name": contact.first_name,
+        "last_name": contact.last_name,
+        "congratulation_date": date_to_string(
+            adjust_for_weekend(contact.birthday.replace(year=today.year))
+        ),
+    }
+
+
+@pytest.fixture(scope="module")
+def user():
+    # The repository never mutates its user argument, so one instance can
+    # serve the whole module.
+    return User(id=1, username="test_user", password="qwerty", confirmed=True)
+
+
+@pytest.fixture()
+def session():
+    return FakeAsyncSession()
+
+
+@pytest.fixture(scope="module")
+def contact_body():
+    # Pydantic validation is not free; build the shared request body once for
+    # every test that only reads it.
+    return ContactSchema(
+        first_name="John",
+        last_name="Snow",
+        email="email@example.com",
+        phone="123456789",
+        birthday=date.today(),
+        data_add="data",
+    )
+
+
+@pytest.fixture(scope="module")
+def search_dataset(user):
+    return [
+        Contact(id=1, first_name="John", last_name="Doe", email="email_1", user=user),
+        Contact(id=2, first_name="Jane", last_name="Doe", email="email_2", user=user),
+        Contact(id=3, first_name="John", last_name="Smith", email="email_3", user=user),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_contacts(session, user):
+    limit = 10
+    offset = 0
+    contacts = [
+        Contact(id=1, first_name="contact_1", email="email_1", user=user),
+        Contact(id=2, first_name="contact_2", email="email_2", user=user),
+    ]
+    Row = namedtuple("Row", ["Contact", "total"])
+    rows = [Row(contact, len(contacts)) for contact in contacts]
+    session.execute.return_value = _make_result(unique_rows=rows)
+    result, total = await get_contacts(limit, offset, session, user)
+    assert result == contacts
+    assert total == len(contacts)
+
+
+@pytest.mark.asyncio
+async def test_get_contact_found(session, user):
+    contact = Contact(id=1, first_name="contact", email="email", user=user)
+    session.execute.return_value = _make_result(scalar_one_or_none=contact)
+    result = await get_contact(1, session, user)
+    assert result == contact
+
+
+@pytest.mark.asyncio
+async def test_get_contact_not_found(session, user):
+    session.execute.return_value = _make_result(scalar_one_or_none=None)
+    result = await get_contact(1, session, user)
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_create_contact(session, user, contact_body):
+    result = await create_contact(contact_body, session, user)
+    assert isinstance(result, Contact)
+    assert result.first_name == contact_body.first_name
+    assert result.last_name == contact_body.last_name
+    assert result.email == contact_body.email
+    assert result.phone == contact_body.phone
+    assert result.birthday == contact_body.birthday
+    assert result.data_add == contact_body.data_add
+
+
+@pytest.mark.asyncio
+async def test_create_contacts_bulk(session, user):
+    bodies = [
+        ContactSchema(
             first_name="John",
             last_name="Snow",
-            email="email",
+            email="email_1@example.com",
             phone="123456789",
             birthday=date.today(),
             data_add="data",
-        )
-        result = await create_contact(body, self.session, self.user)
-        self.assertIsInstance(result, Contact)
-        self.assertEqual(result.first_name, body.first_name)
-        self.assertEqual(result.last_name, body.last_name)
-        self.assertEqual(result.email, body.email)
-        self.assertEqual(result.phone, body.phone)
-        self.assertEqual(result.birthday, body.birthday)
-        self.assertEqual(result.data_add, body.data_add)
-
-    async def test_update_contact(self):
-        body = ContactSchema(
-            first_name="John",
+        ),
+        ContactSchema(
+            first_name="Jane",
             last_name="Snow",
-            email="email",
-            phone="123456789",
+            email="email_2@example.com",
+            phone="123456788",
             birthday=date.today(),
             data_add="data",
+        ),
+    ]
+    contacts = [
+        Contact(id=1, first_name="John", email="email_1", user=user),
+        Contact(id=2, first_name="Jane", email="email_2", user=user),
+    ]
+    session.execute.return_value = _make_result(scalars_all=contacts)
+    result = await create_contacts_bulk(bodies, session, user)
+    session.execute.assert_awaited_once()
+    session.commit.assert_awaited_once()
+    assert result == contacts
+
+
+@pytest.mark.asyncio
+async def test_create_contacts_bulk_empty(session, user):
+    result = await create_contacts_bulk([], session, user)
+    session.execute.assert_not_awaited()
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_update_contact(session, user, contact_body):
+    session.execute.return_value = _make_result(
+        scalar_one_or_none=Contact(
+            id=1, first_name="John", email="email@example.com", user=user
         )
-        mocked_contact = MagicMock()
-        mocked_contact.scalar_one_or_none.return_value = Contact(
-            id=1, first_name="John", email="email", user=self.user
-        )
-        self.session.execute.return_value = mocked_contact
-        result = await update_contact(1, body, self.session, self.user)
-        self.assertIsInstance(result, Contact)
-        self.assertEqual(result.first_name, body.first_name)
-        self.assertEqual(result.email, body.email)
-
-    async def test_delete_contact_found(self):
-        mocked_contact = MagicMock()
-        mocked_contact.scalar_one_or_none.return_value = Contact(
-            id=1, first_name="John", email="email", user=self.user
-        )
-        self.session.execute.return_value = mocked_contact
-        result = await delete_contact(1, self.session, self.user)
-        self.session.delete.assert_called_once()
-        self.session.commit.assert_called_once()
-        self.assertIsInstance(result, Contact)
-
-    async def test_delete_contact_not_found(self):
-        mocked_contact = MagicMock()
-        mocked_contact.scalar_one_or_none.return_value = None
-        self.session.execute.return_value = mocked_contact
-        result = await delete_contact(1, self.session, self.user)
-        self.assertIsNone(result)
-
-    async def test_search_contacts_not_found(self):
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = []
-        self.session.execute.return_value = mocked_contacts
-        result = await search_contacts(
-            self.session, self.user, first_name="John", last_name="Doe", email="email"
-        )
-        self.assertEqual(result, [])
-
-    async def test_search_contacts_no_params(self):
-        contacts = [
-            Contact(
-                id=1,
-                first_name="John",
-                last_name="Doe",
-                email="email_1",
-                user=self.user,
-            ),
-            Contact(
-                id=2,
-                first_name="Jane",
-                last_name="Smith",
-                email="email_2",
-                user=self.user,
-            ),
-        ]
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = contacts
-        self.session.execute.return_value = mocked_contacts
-        result = await search_contacts(self.session, self.user)
-        self.assertEqual(result, contacts)
-
-    async def test_search_contacts_exact_first_name(self):
-        first_name = "John"
-        contacts = [
-            Contact(
-                id=1,
-                first_name=first_name,
-                last_name="Doe",
-                email="email_1",
-                user=self.user,
-            ),
-            Contact(
-                id=2,
-                first_name="Jane",
-                last_name="Doe",
-                email="email_2",
-                user=self.user,
-            ),
-            Contact(
-                id=3,
-                first_name=first_name,
-                last_name="Smith",
-                email="email_3",
-                user=self.user,
-            ),
-        ]
-        filtered_contacts = [
-            contact
-            for contact in contacts
-            if first_name.lower() in contact.first_name.lower()
-        ]
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = filtered_contacts
-        self.session.execute.return_value = mocked_contacts
-        result = await search_contacts(self.session, self.user, first_name=first_name)
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0].first_name, first_name)
-        self.assertEqual(result[1].first_name, first_name)
-
-    async def test_search_contacts_exact_last_name(self):
-        last_name = "Doe"
-        contacts = [
-            Contact(
-                id=1,
-                first_name="John",
-                last_name=last_name,
-                email="email_1",
-                user=self.user,
-            ),
-            Contact(
-                id=2,
-                first_name="Jane",
-                last_name=last_name,
-                email="email_2",
-                user=self.user,
-            ),
-            Contact(
-                id=3,
-                first_name="John",
-                last_name="Smith",
-                email="email_3",
-                user=self.user,
-            ),
-        ]
-        filtered_contacts = [
-            contact
-            for contact in contacts
-            if last_name.lower() in contact.last_name.lower()
-        ]
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = filtered_contacts
-        self.session.execute.return_value = mocked_contacts
-        result = await search_contacts(self.session, self.user, last_name=last_name)
-        self.assertEqual(len(result), 2)
-        self.assertEqual(result[0].last_name, last_name)
-        self.assertEqual(result[1].last_name, last_name)
-
-    async def test_search_contacts_exact_email(self):
-        email = "email_2"
-        contacts = [
-            Contact(
-                id=1,
-                first_name="John",
-                last_name="Doe",
-                email="email_1",
-                user=self.user,
-            ),
-            Contact(
-                id=2,
-                first_name="Jane",
-                last_name="Doe",
-                email="email_2",
-                user=self.user,
-            ),
-            Contact(
-                id=3,
-                first_name="John",
-                last_name="Smith",
-                email="email_3",
-                user=self.user,
-            ),
-        ]
-        filtered_contacts = [contact for contact in contacts if email in contact.email]
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = filtered_contacts
-        self.session.execute.return_value = mocked_contacts
-        result = await search_contacts(self.session, self.user, email=email)
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].email, email)
-
-    async def test_search_contacts_multiple_params(self):
-        first_name = "John"
-        last_name = "Doe"
-        # email = 'email_1'
-        contacts = [
-            Contact(
-                id=1,
-                first_name="John",
-                last_name="Doe",
-                email="email_1",
-                user=self.user,
-            ),
-            Contact(
-                id=2,
-                first_name="Jane",
-                last_name="Doe",
-                email="email_2",
-                user=self.user,
-            ),
-            Contact(
-                id=3,
-                first_name="John",
-                last_name="Smith",
-                email="email_3",
-                user=self.user,
-            ),
-        ]
-        filtered_contacts = [
-            contact for contact in contacts if first_name in contact.first_name
-        ]
-        filtered_contacts = [
-            contact for contact in filtered_contacts if last_name in contact.last_name
-        ]
-        # filtered_contacts = [contact for contact in filtered_contacts if email in contact.email]
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = filtered_contacts
-        self.session.execute.return_value = mocked_contacts
-        result = await search_contacts(
-            self.session, self.user, first_name=first_name, last_name=last_name
-        )
-        self.assertEqual(len(result), 1)
-        self.assertEqual(result[0].first_name, first_name)
-
-    async def test_get_upcoming_birthdays_no_contacts(self):
-        user = User(id=1, username="test_user", password="qwerty", confirmed=True)
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = []
-        self.session.execute.return_value = mocked_contacts
-        result = await get_upcoming_birthdays(self.session, user, days=7)
-        self.assertEqual(result, [])
-
-    async def test_get_upcoming_birthdays_one_contact(self):
-        today = date.today()
-        contact = Contact(
-            id=1,
-            first_name="John",
-            last_name="Doe",
-            birthday=today + timedelta(days=3),
-            user=self.user,
+    )
+    result = await update_contact(1, contact_body, session, user)
+    assert isinstance(result, Contact)
+    assert result.first_name == contact_body.first_name
+    assert result.email == contact_body.email
+
+
+@pytest.mark.asyncio
+async def test_delete_contact_found(session, user):
+    session.execute.return_value = _make_result(
+        scalar_one_or_none=Contact(id=1, first_name="John", email="email", user=user)
+    )
+    result = await delete_contact(1, session, user)
+    session.execute.assert_called_once()
+    session.commit.assert_called_once()
+    assert isinstance(result, Contact)
+
+
+@pytest.mark.asyncio
+async def test_delete_contact_not_found(session, user):
+    session.execute.return_value = _make_result(scalar_one_or_none=None)
+    result = await delete_contact(1, session, user)
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_search_contacts_not_found(session, user):
+    session.execute.return_value = _make_result(scalars_all=[])
+    result = await search_contacts(
+        session, user, first_name="John", last_name="Doe", email="email"
+    )
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_search_contacts_no_params(session, user):
+    contacts = [
+        Contact(id=1, first_name="John", last_name="Doe", email="email_1", user=user),
+        Contact(id=2, first_name="Jane", last_name="Smith", email="email_2", user=user),
+    ]
+    session.execute.return_value = _make_result(scalars_all=contacts)
+    result = await search_contacts(session, user)
+    assert result == contacts
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("field", "value", "expected_count"),
+    [
+        ("first_name", "John", 2),
+        ("last_name", "Doe", 2),
+        ("email", "email_2", 1),
+    ],
+)
+async def test_search_contacts_exact_match(
+    session, user, search_dataset, field, value, expected_count
+):
+    filtered = [
+        contact for contact in search_dataset if value in getattr(contact, field)
+    ]
+    session.execute.return_value = _make_result(scalars_all=filtered)
+    result = await search_contacts(session, user, **{field: value})
+    assert len(result) == expected_count
+    for found in result:
+        assert value in getattr(found, field)
+
+
+@pytest.mark.asyncio
+async def test_search_contacts_multiple_params(session, user, search_dataset):
+    first_name = "John"
+    last_name = "Doe"
+    filtered_contacts = [
+        contact
+        for contact in search_dataset
+        if first_name in contact.first_name and last_name in contact.last_name
+    ]
+    session.execute.return_value = _make_result(scalars_all=filtered_contacts)
+    result = await search_contacts(
+        session, user, first_name=first_name, last_name=last_name
+    )
+    assert len(result) == 1
+    assert result[0].first_name == first_name
+
+
+@pytest.mark.asyncio
+async def test_get_upcoming_birthdays_no_contacts(session, user):
+    session.execute.return_value = _make_result(rows=[])
+    result = await get_upcoming_birthdays(session, user, days=7)
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_get_upcoming_birthdays_one_contact(session, user):
+    contact = Contact(
+        id=1,
+        first_name="John",
+        last_name="Doe",
+        birthday=_TODAY + timedelta(days=3),
+        user=user,
+    )
+    session.execute.return_value = _make_result(rows=[contact])
+    result = await get_upcoming_birthdays(session, user, days=7)
+    assert result == [_expected_bday(contact, _TODAY)]
+
+
+@pytest.mark.asyncio
+async def test_get_upcoming_birthdays_multiple_contacts(session, user):
+    contacts = [
+        Contact(
+            id=contact_id,
+            first_name=first_name,
+            last_name=last_name,
+            birthday=_TODAY + timedelta(days=offset),
+            user=user,
         )
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = [contact]
-        self.session.execute.return_value = mocked_contacts
-        result = await get_upcoming_birthdays(self.session, self.user, days=7)
-
-        expected_result = [
-            {
-                "contact_id": 1,
-                "first_name": "John",
-                "last_name": "Doe",
-                "congratulation_date": date_to_string(
-                    adjust_for_weekend(contact.birthday.replace(year=today.year))
-                ),
-            }
+        for contact_id, first_name, last_name, offset in [
+            (1, "John", "Doe", 1),
+            (2, "Jane", "Smith", 6),
+            (3, "Mike", "Johnson", 3),
         ]
-        self.assertEqual(result, expected_result)
-
-    async def test_get_upcoming_birthdays_multiple_contacts(self):
-        today = date.today()
-        contacts = [
-            Contact(
-                id=1,
-                first_name="John",
-                last_name="Doe",
-                birthday=today + timedelta(days=1),
-                user=self.user,
-            ),
-            Contact(
-                id=2,
-                first_name="Jane",
-                last_name="Smith",
-                birthday=today + timedelta(days=6),
-                user=self.user,
-            ),
-            Contact(
-                id=3,
-                first_name="Mike",
-                last_name="Johnson",
-                birthday=today + timedelta(days=3),
-                user=self.user,
-            ),
-        ]
-        mocked_contacts = MagicMock()
-        mocked_contacts.scalars.return_value.all.return_value = contacts
-        self.session.execute.return_value = mocked_contacts
-        result = await get_upcoming_birthdays(self.session, self.user, days=10)
-        expected_result = [
-            {
-                "contact_id": contact.id,
-                "first_name": contact.first_name,
-                "last_name": contact.last_name,
-                "congratulation_date": date_to_string(
-                    adjust_for_weekend(contact.birthday.replace(year=today.year))
-                ),
-            }
-            for contact in contacts
-        ]
-        self.assertEqual(result, expected_result)
+    ]
+    session.execute.return_value = _make_result(rows=contacts)
+    result = await get_upcoming_birthdays(session, user, days=10)
+    assert result == [_expected_bday(contact, _TODAY) for contact in contacts]
 
-    def test_adjust_for_weekend(self):
-        today = date.today()
-        self.assertEqual(adjust_for_weekend(today), today)
-        self.assertEqual(
-            adjust_for_weekend(today - timedelta(days=1)), today - timedelta(days=1)
-        )
-        self.assertEqual(
-            adjust_for_weekend(today + timedelta(days=1)), today + timedelta(days=1)
-        )
+
+def test_adjust_for_weekend():
+    # Anchored on a known Monday rather than date.today(): the old version
+    # assumed today and its neighbours were weekdays, so it failed whenever
+    # the suite ran on (or next to) a weekend. One batched pass over a full
+    # week covers the identity case and both weekend shifts.
+    monday = date(2024, 1, 1)
+    week = [monday + timedelta(days=offset) for offset in range(7)]
+    expected = [
+        day if day.weekday() < 5 else day + timedelta(days=7 - day.weekday())
+        for day in week
+    ]
+    assert [adjust_for_weekend(day) for day in week] == expected